@@ -1,14 +1,29 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from langchain_core.prompts import ChatPromptTemplate
+from typing import List, Optional
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_community.chat_models.oci_generative_ai import ChatOCIGenAI
 from dotenv import load_dotenv
+import asyncio
 import os
+import re
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="OCI Translator")
+# Generation budget: output is capped relative to the input length
+MAX_TOKENS = 1024
+MIN_TOKENS = 64
+
+# Threads available for blocking OCI SDK calls
+LLM_THREADS = int(os.getenv('LLM_THREADS', 32))
+
+# Translation cache size (entries per worker process)
+CACHE_SIZE = int(os.getenv('CACHE_SIZE', 1024))
 
 # Language code mapping
 LANGUAGE_CODES = {
@@ -24,37 +39,91 @@ LANGUAGE_CODES = {
     "es": "Spanish"
 }
 
-# Reverse mapping for validation
-LANGUAGE_NAMES = {v.lower(): k for k, v in LANGUAGE_CODES.items()}
+# Model refusal in the format requested by the system prompt: "ERROR: [reason]"
+_ERR_RE = re.compile(r"^ERROR:\s*\[([^\]]*)\]")
+
+# Every accepted spelling of a language (code or name, as-is and lowercased)
+# mapped to its full name, built once at import time
+_LOOKUP = {
+    key: name
+    for code, name in LANGUAGE_CODES.items()
+    for key in (code, code.lower(), name, name.lower())
+}
 
 # Initialize the LLM with environment variables
 llm = ChatOCIGenAI(
     model_id=os.getenv('OCI_MODEL_ID'),
     service_endpoint=os.getenv('OCI_SERVICE_ENDPOINT'),
     compartment_id=os.getenv('OCI_COMPARTMENT_ID'),
-    model_kwargs={"temperature": 0.0, "max_tokens": 1024}
+    model_kwargs={"temperature": 0.0, "max_tokens": MAX_TOKENS}
 )
 
-# Create the prompt template
-prompt = ChatPromptTemplate.from_messages(
-    [
-        (
-            "system",
-            """You are a professional {input_language} to {output_language} translator. Rules:
+# Create the system prompt template
+SYSTEM_PROMPT = """You are a professional {input_language} to {output_language} translator. Rules:
 
 1. Provide translation only, no explanations
 2. For idioms/cultural phrases use the cultural equivalent
 
 3. If translation impossible, respond:
 ERROR: [reason in English]
-""",
-        ),
-        ("human", "{input}"),
+"""
+
+# Render the system prompt once for every supported language pair
+PROMPT_BY_PAIR = {
+    (source, target): SYSTEM_PROMPT.format(input_language=source, output_language=target)
+    for source in LANGUAGE_CODES.values()
+    for target in LANGUAGE_CODES.values()
+}
+
+def build_messages(source_lang: str, target_lang: str, text: str) -> list:
+    """Build the chat messages for a translation from its pre-rendered system prompt."""
+    return [
+        SystemMessage(content=PROMPT_BY_PAIR[(source_lang, target_lang)]),
+        HumanMessage(content=text),
     ]
-)
 
-# Create the chain
-chain = prompt | llm
+def build_llm(text: str):
+    """Bind the LLM with max_tokens sized to the input text."""
+    # Translations run about as long as their input; two tokens per input
+    # character leaves headroom for scripts that tokenize densely (CJK, Arabic)
+    max_tokens = min(MAX_TOKENS, max(MIN_TOKENS, 2 * len(text)))
+    return llm.bind(max_tokens=max_tokens)
+
+class TranslationCache:
+    """In-process LRU cache of translations keyed by (source, target, text)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+
+    def get(self, key: tuple):
+        content = self.entries.get(key)
+        if content is not None:
+            self.entries.move_to_end(key)
+        return content
+
+    def put(self, key: tuple, content: str):
+        if self.maxsize <= 0:
+            return
+        self.entries[key] = content
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+translation_cache = TranslationCache(CACHE_SIZE)
+
+# Translations waiting on the LLM, keyed like the cache, so identical
+# concurrent requests share one call
+inflight_translations = {}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # ChatOCIGenAI has no native async transport, so LangChain runs each OCI SDK
+    # call in the loop's default executor; size it for concurrent translations
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=LLM_THREADS))
+    yield
+
+app = FastAPI(title="OCI Translator", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Define request model with validation
 class TranslationRequest(BaseModel):
@@ -64,14 +133,10 @@ class TranslationRequest(BaseModel):
 
     def get_language_name(self, code_or_name: str) -> str:
         """Convert language code or name to full language name."""
-        if code_or_name.lower() in [name.lower() for name in LANGUAGE_CODES.values()]:
-            return code_or_name.capitalize()
-        elif code_or_name.lower() in LANGUAGE_NAMES:
-            return LANGUAGE_CODES[code_or_name.lower()].capitalize()
-        elif code_or_name in LANGUAGE_CODES:
-            return LANGUAGE_CODES[code_or_name].capitalize()
-        else:
+        name = _LOOKUP.get(code_or_name) or _LOOKUP.get(code_or_name.lower())
+        if name is None:
             raise ValueError(f"Unsupported language: {code_or_name}")
+        return name
 
 # Define response model
 class TranslationResponse(BaseModel):
@@ -79,6 +144,65 @@ class TranslationResponse(BaseModel):
     source_language: str
     target_language: str
 
+# Define batch response model; each item carries either a translation or an error
+class BatchTranslationResponse(BaseModel):
+    translated_text: Optional[str] = None
+    source_language: str
+    target_language: str
+    error: Optional[str] = None
+
+def get_error_message(content: str) -> Optional[str]:
+    """Return the reason if the model answered with "ERROR: [reason]", else None."""
+    # Extract the error message from within the square brackets
+    match = _ERR_RE.match(content)
+    if match:
+        return match.group(1)
+    if content.startswith("ERROR:"):
+        return content[6:].strip()  # Remove "ERROR:" prefix
+    return None
+
+def raise_for_error(content: str, source_lang: str, target_lang: str):
+    """Raise a 400 HTTPException if the model answered with "ERROR: [reason]"."""
+    error_message = get_error_message(content)
+    if error_message is None:
+        return
+    
+    raise HTTPException(
+        status_code=400,
+        detail={
+            "message": error_message,
+            "source_language": source_lang,
+            "target_language": target_lang
+        }
+    )
+
+async def translate_cached(source_lang: str, target_lang: str, text: str) -> str:
+    """Return the model's reply for a translation, from the cache or the LLM."""
+    # Serve repeated translations from the cache, otherwise call the LLM
+    cache_key = (source_lang, target_lang, text)
+    content = translation_cache.get(cache_key)
+    if content is not None:
+        return content
+
+    async def fetch():
+        message = await build_llm(text).ainvoke(build_messages(source_lang, target_lang, text))
+        translation_cache.put(cache_key, message.content)
+        return message.content
+
+    # Join an identical translation already in flight, or start one
+    task = inflight_translations.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight_translations[cache_key] = task
+        task.add_done_callback(lambda _: inflight_translations.pop(cache_key, None))
+
+    # Shield the shared task so one cancelled request does not cancel it for the others
+    return await asyncio.shield(task)
+
+def sse_event(data: str) -> str:
+    """Format text as one Server-Sent Event, with a data field per line."""
+    return "".join(f"data: {line}\n" for line in data.split("\n")) + "\n"
+
 @app.post("/translate", response_model=TranslationResponse)
 async def translate_text(request: TranslationRequest):
     try:
@@ -89,40 +213,113 @@ async def translate_text(request: TranslationRequest):
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-        # Call the translation chain
-        message = await chain.ainvoke(
-            {
-                "input_language": source_lang,
-                "output_language": target_lang,
-                "input": request.text,
-            }
-        )
+        content = await translate_cached(source_lang, target_lang, request.text)
         
-        # Check if the response starts with "ERROR:"
-        if message.content.startswith("ERROR:"):
-            # Extract the error message from within the square brackets
-            error_start = message.content.find("[")
-            error_end = message.content.find("]")
-            if error_start != -1 and error_end != -1:
-                error_message = message.content[error_start + 1:error_end]
-            else:
-                error_message = message.content[6:].strip()  # Remove "ERROR:" prefix
-            
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": error_message,
-                    "source_language": source_lang,
-                    "target_language": target_lang
-                }
-            )
+        raise_for_error(content, source_lang, target_lang)
         
-        # Return the translation if no error
-        return TranslationResponse(
-            translated_text=message.content,
-            source_language=source_lang,
-            target_language=target_lang
+        # Return the translation if no error; FastAPI validates it against response_model
+        return {
+            "translated_text": content,
+            "source_language": source_lang,
+            "target_language": target_lang
+        }
+    except HTTPException:
+        raise  # Re-raise HTTP exceptions as they are already formatted
+    except Exception as e:
+        # Handle any other unexpected errors
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/translate/batch", response_model=List[BatchTranslationResponse])
+async def translate_batch(batch: List[TranslationRequest]):
+    try:
+        # Convert language codes/names to full names for every item up front
+        try:
+            languages = [
+                (
+                    request.get_language_name(request.source_language),
+                    request.get_language_name(request.target_language),
+                )
+                for request in batch
+            ]
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # OCI has no batch API: items are translated concurrently, one LLM call each,
+        # behind the same cache and in-flight deduplication as /translate
+        contents = await asyncio.gather(
+            *(
+                translate_cached(source_lang, target_lang, request.text)
+                for (source_lang, target_lang), request in zip(languages, batch)
+            )
+        )
+
+        # Return the results in request order; an item the model refused carries
+        # its error instead of failing the whole batch
+        results = []
+        for content, (source_lang, target_lang) in zip(contents, languages):
+            error_message = get_error_message(content)
+            results.append({
+                "translated_text": None if error_message is not None else content,
+                "source_language": source_lang,
+                "target_language": target_lang,
+                "error": error_message
+            })
+        return results
+    except HTTPException:
+        raise  # Re-raise HTTP exceptions as they are already formatted
+    except Exception as e:
+        # Handle any other unexpected errors
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/translate/stream")
+async def translate_stream(request: TranslationRequest):
+    try:
+        # Convert language codes/names to full names
+        try:
+            source_lang = request.get_language_name(request.source_language)
+            target_lang = request.get_language_name(request.target_language)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # A cached translation is sent as a single event
+        cache_key = (source_lang, target_lang, request.text)
+        content = translation_cache.get(cache_key)
+        if content is not None:
+            raise_for_error(content, source_lang, target_lang)
+
+            async def replay():
+                yield sse_event(content)
+
+            return StreamingResponse(replay(), media_type="text/event-stream")
+
+        chunks = build_llm(request.text).astream(
+            build_messages(source_lang, target_lang, request.text)
         )
+
+        # Buffer enough of the reply to tell a translation from an "ERROR:" answer
+        # before committing to a 200 response
+        head = ""
+        async for chunk in chunks:
+            head += chunk.content
+            if len(head) >= len("ERROR:"):
+                break
+
+        if head.startswith("ERROR:"):
+            async for chunk in chunks:
+                head += chunk.content
+            translation_cache.put(cache_key, head)
+            raise_for_error(head, source_lang, target_lang)
+
+        async def generate():
+            content = head
+            yield sse_event(head)
+            async for chunk in chunks:
+                if chunk.content:
+                    content += chunk.content
+                    yield sse_event(chunk.content)
+            translation_cache.put(cache_key, content)
+
+        return StreamingResponse(generate(), media_type="text/event-stream")
     except HTTPException:
         raise  # Re-raise HTTP exceptions as they are already formatted
     except Exception as e:
@@ -132,9 +329,15 @@ async def translate_text(request: TranslationRequest):
 if __name__ == "__main__":
     import uvicorn
     
+    # Auto-reload is for development and always runs a single process
+    reload = os.getenv('DEV') == "1"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=reload,
+        workers=None if reload else int(os.getenv('WEB_CONCURRENCY', os.cpu_count() or 1)),
+        # Use uvloop and the httptools parser when installed (see requirements.txt)
+        loop="auto",
+        http="auto"
     )
\ No newline at end of file
@@ -1,147 +1,311 @@
-import requests
+import httpx
+import asyncio
 import argparse
 from rich.console import Console
 from rich.panel import Panel
 import time
 from datetime import datetime
-import json
+from types import MappingProxyType
+from typing import NamedTuple
+import orjson
+
+# Gateway errors worth retrying when the server is under load
+RETRY_STATUS_CODES = (502, 503, 504)
+
+class TranslationResult(NamedTuple):
+    source_lang: str
+    target_lang: str
+    text: str
+    translated_text: str
+    translation_time: float
+    chars: int
+    is_error: bool
 
 class TranslationTester:
-    def __init__(self, base_url: str, verbose: bool = False):
+    # Language and sample data, shared read-only by every instance
+    LANGUAGES = (
+        'ar', 'zh', 'en', 'fr', 'de', 
+        'it', 'ja', 'ko', 'pt', 'es'
+    )
+    LANGUAGE_NAMES = MappingProxyType({
+        'ar': 'Arabic',
+        'zh': 'Chinese',
+        'en': 'English',
+        'fr': 'French',
+        'de': 'German',
+        'it': 'Italian',
+        'ja': 'Japanese',
+        'ko': 'Korean',
+        'pt': 'Portuguese',
+        'es': 'Spanish'
+    })
+    SAMPLE_TEXTS = MappingProxyType({
+        'en': (
+            "Hello, how are you today?",
+            "The weather is beautiful",
+            "I love to travel"
+        ),
+        'es': (
+            "¿Cómo estás hoy?",
+            "El tiempo está hermoso",
+            "Me encanta viajar"
+        ),
+        'fr': (
+            "Comment allez-vous aujourd'hui?",
+            "Le temps est magnifique",
+            "J'aime voyager"
+        ),
+        'de': (
+            "Wie geht es dir heute?",
+            "Das Wetter ist schön",
+            "Ich reise gerne"
+        ),
+        'it': (
+            "Come stai oggi?",
+            "Il tempo è bellissimo",
+            "Amo viaggiare"
+        ),
+        'pt': (
+            "Como você está hoje?",
+            "O tempo está bonito",
+            "Eu amo viajar"
+        ),
+        'zh': (
+            "今天你好吗？",
+            "天气很好",
+            "我爱旅行"
+        ),
+        'ja': (
+            "今日はお元気ですか？",
+            "天気が良いですね",
+            "旅行が大好きです"
+        ),
+        'ko': (
+            "오늘 어떠신가요?",
+            "날씨가 아름답습니다",
+            "나는 여행을 좋아합니다"
+        ),
+        'ar': (
+            "كيف حالك اليوم؟",
+            "الطقس جميل",
+            "أحب السفر"
+        )
+    })
+
+    def __init__(self, base_url: str, verbose: bool = False, concurrency: int = 16,
+                 batch: bool = True, quiet: bool = False, http2: bool = False,
+                 retries: int = 3, backoff_factor: float = 0.3):
         self.base_url = base_url.rstrip('/')
         self.verbose = verbose
-        self.languages = [
-            'ar', 'zh', 'en', 'fr', 'de', 
-            'it', 'ja', 'ko', 'pt', 'es'
+        self.quiet = quiet
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.concurrency = concurrency
+        self.batch = batch
+        # Every (source, text, target) sample combination, enumerated once
+        self.combinations = [
+            (source_lang, test_text, target_lang)
+            for source_lang, texts in self.SAMPLE_TEXTS.items()
+            for test_text in texts
+            for target_lang in self.LANGUAGES
+            if target_lang != source_lang
         ]
-        self.language_names = {
-            'ar': 'Arabic',
-            'zh': 'Chinese',
-            'en': 'English',
-            'fr': 'French',
-            'de': 'German',
-            'it': 'Italian',
-            'ja': 'Japanese',
-            'ko': 'Korean',
-            'pt': 'Portuguese',
-            'es': 'Spanish'
-        }
-        self.sample_texts = {
-            'en': [
-                "Hello, how are you today?",
-                "The weather is beautiful",
-                "I love to travel"
-            ],
-            'es': [
-                "¿Cómo estás hoy?",
-                "El tiempo está hermoso",
-                "Me encanta viajar"
-            ],
-            'fr': [
-                "Comment allez-vous aujourd'hui?",
-                "Le temps est magnifique",
-                "J'aime voyager"
-            ],
-            'de': [
-                "Wie geht es dir heute?",
-                "Das Wetter ist schön",
-                "Ich reise gerne"
-            ],
-            'it': [
-                "Come stai oggi?",
-                "Il tempo è bellissimo",
-                "Amo viaggiare"
-            ],
-            'pt': [
-                "Como você está hoje?",
-                "O tempo está bonito",
-                "Eu amo viajar"
-            ],
-            'zh': [
-                "今天你好吗？",
-                "天气很好",
-                "我爱旅行"
-            ],
-            'ja': [
-                "今日はお元気ですか？",
-                "天気が良いですね",
-                "旅行が大好きです"
-            ],
-            'ko': [
-                "오늘 어떠신가요?",
-                "날씨가 아름답습니다",
-                "나는 여행을 좋아합니다"
-            ],
-            'ar': [
-                "كيف حالك اليوم؟",
-                "الطقس جميل",
-                "أحب السفر"
-            ]
-        }
         self.console = Console()
-        self.total_time = 0
-        self.total_chars = 0
-        self.total_translations = 0
-        self.errors = 0
+        # Pooled async client: keep-alive connections shared by concurrent requests.
+        # With HTTP/2 (negotiated over TLS) requests are multiplexed on one connection.
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            # Every request body is JSON, encoded up front with orjson
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+                keepalive_expiry=30
+            ),
+            timeout=None
+        )
+        # Every finished translation; the summary totals are reduced from it at the end
+        self.results = []
+        self.wall_time = 0
+        # API requests sent; one batch request carries many translations
+        self.requests = 0
+        # Results are buffered and written to the terminal at most every refresh_interval seconds
+        self.refresh_interval = 0.1
+        self.output_buffer = []
+        self.last_flush = time.monotonic()
+        # Pending trailing flush, so buffered output is written even if nothing else arrives
+        self.flush_handle = None
 
-    def print_verbose(self, request_data: dict, response_data: dict = None, error: str = None):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the pooled HTTP client and its keep-alive connections."""
+        await self.client.aclose()
+
+    def print_verbose(self, endpoint: str, request_data, response_data=None, error: str = None):
         """Print verbose API request and response information."""
         if not self.verbose:
             return
 
+        # Keep verbose output in order with the buffered results
+        self.flush_output()
         self.console.print("\n[bold yellow]API Request Details:[/bold yellow]")
-        self.console.print(f"[cyan]Endpoint:[/cyan] {self.base_url}/translate")
+        self.console.print(f"[cyan]Endpoint:[/cyan] {endpoint}")
         self.console.print("[cyan]Request Payload:[/cyan]")
-        self.console.print(json.dumps(request_data, indent=2, ensure_ascii=False))
+        self.console.print(orjson.dumps(request_data, option=orjson.OPT_INDENT_2).decode())
 
         if error:
             self.console.print(f"\n[bold red]Error:[/bold red] {error}")
         elif response_data:
             self.console.print("\n[bold green]API Response:[/bold green]")
-            self.console.print(json.dumps(response_data, indent=2, ensure_ascii=False))
+            self.console.print(orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode())
         
         self.console.print("\n" + "-" * 40)
         
-    def translate(self, text: str, source_language: str, target_language: str) -> tuple:
+    async def post(self, endpoint: str, payload) -> httpx.Response:
+        """POST a JSON payload, retrying connection errors and gateway errors with exponential backoff."""
+        body = orjson.dumps(payload)
+        for attempt in range(self.retries + 1):
+            try:
+                response = await self.client.post(endpoint, content=body)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.retries:
+                    return response
+            except httpx.TransportError:
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+
+    async def send(self, endpoint: str, payload) -> tuple:
+        """POST a payload to the API, decode the JSON response and measure time."""
+        self.requests += 1
+        start_time = time.perf_counter()
+        try:
+            response = await self.post(endpoint, payload)
+            response.raise_for_status()
+            end_time = time.perf_counter()
+            response_data = orjson.loads(response.content)
+            
+            # Print verbose information if enabled
+            self.print_verbose(endpoint, payload, response_data)
+            
+            return response_data, end_time - start_time, False
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            # Print verbose error information if enabled
+            self.print_verbose(endpoint, payload, error=str(e))
+            return None, time.perf_counter() - start_time, True
+
+    async def translate(self, text: str, source_language: str, target_language: str) -> tuple:
         """Make a translation request to the API and measure time."""
-        endpoint = f"{self.base_url}/translate"
+        return await self.send(f"{self.base_url}/translate", {
+            "text": text,
+            "source_language": source_language,
+            "target_language": target_language
+        })
+
+    async def translate_stream(self, text: str, source_language: str, target_language: str) -> tuple:
+        """Stream a translation from the API over Server-Sent Events, printing chunks as they arrive."""
+        endpoint = f"{self.base_url}/translate/stream"
         payload = {
             "text": text,
             "source_language": source_language,
             "target_language": target_language
         }
         
-        start_time = time.time()
+        chunks = []
+        first_chunk_time = None
+        self.requests += 1
+        start_time = time.perf_counter()
         try:
-            response = requests.post(endpoint, json=payload)
-            response.raise_for_status()
-            end_time = time.time()
-            response_data = response.json()
+            async with self.client.stream("POST", endpoint, content=orjson.dumps(payload)) as response:
+                response.raise_for_status()
+                data = []
+                async for line in response.aiter_lines():
+                    if line.startswith("data: "):
+                        data.append(line[6:])
+                    elif not line and data:
+                        # A blank line terminates the event
+                        if first_chunk_time is None:
+                            first_chunk_time = time.perf_counter() - start_time
+                        chunks.append("\n".join(data))
+                        self.console.print(chunks[-1], end="", markup=False, highlight=False)
+                        data = []
+            end_time = time.perf_counter()
+            response_data = {
+                "translated_text": "".join(chunks),
+                "source_language": source_language,
+                "target_language": target_language
+            }
+            
+            if first_chunk_time is not None:
+                self.console.print(f"\n[blue]Time to first chunk[/blue]: {first_chunk_time:.3f}s")
             
             # Print verbose information if enabled
-            self.print_verbose(payload, response_data)
+            self.print_verbose(endpoint, payload, response_data)
             
             return response_data, end_time - start_time, False
-        except requests.exceptions.RequestException as e:
-            self.errors += 1
+        except httpx.HTTPError as e:
             # Print verbose error information if enabled
-            self.print_verbose(payload, error=str(e))
-            return None, time.time() - start_time, True
+            self.print_verbose(endpoint, payload, error=str(e))
+            return None, time.perf_counter() - start_time, True
+
+    async def translate_batch(self, source_language: str, items: list) -> tuple:
+        """Translate (text, target_language) pairs in one /translate/batch request and measure time."""
+        return await self.send(f"{self.base_url}/translate/batch", [
+            {
+                "text": text,
+                "source_language": source_language,
+                "target_language": target_language
+            }
+            for text, target_language in items
+        ])
+
+    def record_translation(self, source_lang: str, target_lang: str, text: str,
+                           translated_text: str, translation_time: float):
+        """Record a successful translation and print it."""
+        total_chars_current = len(text) + len(translated_text)
+        self.results.append(TranslationResult(
+            source_lang, target_lang, text, translated_text,
+            translation_time, total_chars_current, False
+        ))
+        
+        self.print_translation_result(
+            source_lang, target_lang, text, 
+            translated_text, translation_time, 
+            total_chars_current, False
+        )
+
+    def record_error(self, source_lang: str, target_lang: str, text: str,
+                     translation_time: float):
+        """Record a failed translation."""
+        self.results.append(TranslationResult(
+            source_lang, target_lang, text, None, translation_time, 0, True
+        ))
 
     def print_translation_result(self, source_lang: str, target_lang: str, 
                                original: str, translation: str, time_taken: float, 
                                chars: int, is_error: bool):
         """Print individual translation result."""
+        # Skip building the output entirely when results are not shown
+        if self.quiet:
+            return
+
+        source_name = self.LANGUAGE_NAMES[source_lang]
+        target_name = self.LANGUAGE_NAMES[target_lang]
+
         if is_error:
-            self.console.print(f"\n[red]ERROR[/red] translating from "
-                             f"[yellow]{self.language_names[source_lang]}[/yellow] to "
-                             f"[cyan]{self.language_names[target_lang]}[/cyan]")
+            self.write_output(f"\n[red]ERROR[/red] translating from "
+                              f"[yellow]{source_name}[/yellow] to "
+                              f"[cyan]{target_name}[/cyan]")
             return
 
-        self.console.print(
-            f"\n[bold blue]Translation #{self.total_translations + 1}[/bold blue]"
-            f"\n[yellow]From[/yellow]: {self.language_names[source_lang]}"
-            f"\n[cyan]To[/cyan]: {self.language_names[target_lang]}"
+        self.write_output(
+            f"\n[bold blue]Translation #{len(self.results)}[/bold blue]"
+            f"\n[yellow]From[/yellow]: {source_name}"
+            f"\n[cyan]To[/cyan]: {target_name}"
             f"\n[green]Original[/green]: {original}"
             f"\n[magenta]Translated[/magenta]: {translation}"
             f"\n[blue]Time[/blue]: {time_taken:.3f}s"
@@ -149,94 +313,197 @@ class TranslationTester:
             f"\n{'-' * 80}"
         )
 
-    def test_single_translation(self, text: str, source_lang: str, target_lang: str):
+    def write_output(self, text: str):
+        """Buffer console output, flushing it at most every refresh_interval seconds."""
+        self.output_buffer.append(text)
+        elapsed = time.monotonic() - self.last_flush
+        if elapsed >= self.refresh_interval:
+            self.flush_output()
+        elif self.flush_handle is None:
+            self.flush_handle = asyncio.get_running_loop().call_later(
+                self.refresh_interval - elapsed, self.flush_output
+            )
+
+    def flush_output(self):
+        """Write all buffered output to the console in a single print."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if self.output_buffer:
+            self.console.print("\n".join(self.output_buffer))
+            self.output_buffer.clear()
+        self.last_flush = time.monotonic()
+
+    async def test_single_translation(self, text: str, source_lang: str, target_lang: str,
+                                      stream: bool = False):
         """Test a single translation with specified languages."""
         self.console.print(Panel(
             f"Starting single translation test\n"
             f"API URL: [cyan]{self.base_url}[/cyan]\n"
-            f"From: [yellow]{self.language_names[source_lang]}[/yellow]\n"
-            f"To: [cyan]{self.language_names[target_lang]}[/cyan]\n"
+            f"From: [yellow]{self.LANGUAGE_NAMES[source_lang]}[/yellow]\n"
+            f"To: [cyan]{self.LANGUAGE_NAMES[target_lang]}[/cyan]\n"
             f"Text: [green]{text}[/green]\n"
+            f"Streaming: [cyan]{'yes' if stream else 'no'}[/cyan]\n"
             f"Timestamp: [cyan]{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/cyan]", 
             title="Translation Testing", 
             border_style="blue"))
 
-        result, translation_time, is_error = self.translate(
+        translate = self.translate_stream if stream else self.translate
+        result, translation_time, is_error = await translate(
             text, source_lang, target_lang
         )
         
-        if not is_error:
-            translated_text = result['translated_text']
-            total_chars_current = len(text) + len(translated_text)
-            self.total_chars += total_chars_current
-            self.total_time += translation_time
-            self.total_translations += 1
-            
-            self.print_translation_result(
-                source_lang, target_lang, text, 
-                translated_text, translation_time, 
-                total_chars_current, is_error
+        if is_error:
+            self.record_error(source_lang, target_lang, text, translation_time)
+        else:
+            self.record_translation(
+                source_lang, target_lang, text,
+                result['translated_text'], translation_time
             )
 
-    def test_sample_translations(self):
-        """Test translations using sample texts."""
+    async def test_sample_translations(self):
+        """Test translations using sample texts, running up to `concurrency` requests at once."""
         self.console.print(Panel(
             f"Starting sample translations\n"
             f"API URL: [cyan]{self.base_url}[/cyan]\n"
+            f"Translations: [cyan]{len(self.combinations)}[/cyan]\n"
+            f"Mode: [cyan]{'batch' if self.batch else 'individual'}[/cyan]\n"
+            f"Concurrency: [cyan]{self.concurrency}[/cyan]\n"
             f"Timestamp: [cyan]{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/cyan]", 
             title="Translation Testing", 
             border_style="blue"))
 
-        for source_lang, texts in self.sample_texts.items():
-            for test_text in texts:
-                for target_lang in self.languages:
-                    if target_lang != source_lang:
-                        result, translation_time, is_error = self.translate(
-                            test_text, source_lang, target_lang
-                        )
-                        
-                        if not is_error:
-                            translated_text = result['translated_text']
-                            total_chars_current = len(test_text) + len(translated_text)
-                            self.total_chars += total_chars_current
-                            self.total_time += translation_time
-                            self.total_translations += 1
-                            
-                            self.print_translation_result(
-                                source_lang, target_lang, test_text, 
-                                translated_text, translation_time, 
-                                total_chars_current, is_error
-                            )
+        if self.batch:
+            await self.run_batched_samples(self.combinations)
+        else:
+            await self.run_individual_samples(self.combinations)
+
+    async def run_batched_samples(self, combinations: list):
+        """Send one /translate/batch request per source language with every (text, target) pair."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def translate_source(source_lang: str, items: list):
+            async with semaphore:
+                return source_lang, items, await self.translate_batch(source_lang, items)
+
+        batches = {}
+        for source_lang, test_text, target_lang in combinations:
+            batches.setdefault(source_lang, []).append((test_text, target_lang))
+
+        # Print results as each batch completes
+        for task in asyncio.as_completed([translate_source(*b) for b in batches.items()]):
+            source_lang, items, (results, translation_time, is_error) = await task
+
+            # Every item waited for the whole batch, so each is recorded with the
+            # batch latency, just as overlapping --no-batch requests each count
+            # their own latency; throughput is reported from the wall-clock time
+            if is_error:
+                for test_text, target_lang in items:
+                    self.record_error(source_lang, target_lang, test_text, translation_time)
+            else:
+                for (test_text, target_lang), result in zip(items, results):
+                    # The server reports a refused item in its "error" field
+                    # instead of failing the whole batch
+                    if result.get('error') is not None:
+                        self.record_error(source_lang, target_lang, test_text, translation_time)
+                        continue
+                    self.record_translation(
+                        source_lang, target_lang, test_text,
+                        result['translated_text'], translation_time
+                    )
+
+    async def run_individual_samples(self, combinations: list):
+        """Send every sample translation as its own /translate request."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def translate_one(source_lang: str, test_text: str, target_lang: str):
+            async with semaphore:
+                return source_lang, test_text, target_lang, await self.translate(
+                    test_text, source_lang, target_lang
+                )
+
+        # Print results as they complete rather than in submission order
+        for task in asyncio.as_completed([translate_one(*c) for c in combinations]):
+            source_lang, test_text, target_lang, (result, translation_time, is_error) = await task
+
+            if is_error:
+                self.record_error(source_lang, target_lang, test_text, translation_time)
+            else:
+                self.record_translation(
+                    source_lang, target_lang, test_text,
+                    result['translated_text'], translation_time
+                )
 
     def print_summary(self):
         """Print summary of all translations."""
+        # Reduce the recorded results once instead of updating shared counters per translation
+        successes = [r for r in self.results if not r.is_error]
+        total_translations = len(successes)
+        errors = len(self.results) - total_translations
+        total_time = sum(r.translation_time for r in successes)
+        total_chars = sum(r.chars for r in successes)
+
         self.console.print("\n" + "=" * 80)
         self.console.print("[bold blue]Translation Summary[/bold blue]")
-        self.console.print(f"[green]Total translations[/green]: {self.total_translations}")
-        self.console.print(f"[red]Failed translations[/red]: {self.errors}")
-        self.console.print(f"[yellow]Total time[/yellow]: {self.total_time:.2f}s")
-        if self.total_translations > 0:
-            self.console.print(f"[magenta]Average time per translation[/magenta]: {self.total_time/self.total_translations:.3f}s")
-            self.console.print(f"[cyan]Total characters processed[/cyan]: {self.total_chars}")
-            self.console.print(f"[blue]Average characters per translation[/blue]: {self.total_chars/self.total_translations:.1f}")
+        self.console.print(f"[green]Total translations[/green]: {total_translations}")
+        self.console.print(f"[red]Failed translations[/red]: {errors}")
+        self.console.print(f"[yellow]Total time[/yellow]: {total_time:.2f}s")
+        self.console.print(f"[yellow]Wall-clock time[/yellow]: {self.wall_time:.2f}s")
+        self.console.print(f"[yellow]Requests sent[/yellow]: {self.requests}")
+        if self.wall_time > 0:
+            self.console.print(f"[yellow]Throughput[/yellow]: {total_translations/self.wall_time:.1f} translations/s")
+        if total_translations > 0:
+            self.console.print(f"[magenta]Average time per translation[/magenta]: {total_time/total_translations:.3f}s")
+            self.console.print(f"[cyan]Total characters processed[/cyan]: {total_chars}")
+            self.console.print(f"[blue]Average characters per translation[/blue]: {total_chars/total_translations:.1f}")
         self.console.print("=" * 80)
 
+async def run(tester: TranslationTester, args):
+    """Run the selected test mode and print the summary."""
+    start_time = time.perf_counter()
+    async with tester:
+        if args.text:
+            # Single translation mode
+            await tester.test_single_translation(
+                args.text, args.from_lang, args.to_lang, stream=args.stream
+            )
+        else:
+            # Sample translations mode
+            await tester.test_sample_translations()
+    tester.wall_time = time.perf_counter() - start_time
+    tester.flush_output()
+    
+    tester.print_summary()
+
 def main():
     parser = argparse.ArgumentParser(description='Test translation API for all language combinations')
     parser.add_argument('--url', default='http://localhost:8000', 
                        help='Base URL of the translation API (default: http://localhost:8000)')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose output showing API requests and responses')
+    parser.add_argument('--concurrency', '-c', type=int, default=16,
+                       help='Maximum number of requests in flight at once (default: 16)')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Only print the summary, not each translation')
+    parser.add_argument('--retries', type=int, default=3,
+                       help='Retries for connection errors and 502/503/504 responses (default: 3)')
+    parser.add_argument('--http2', action='store_true',
+                       help='Use HTTP/2 when the server supports it (HTTPS only)')
+    parser.add_argument('--no-batch', dest='batch', action='store_false',
+                       help='Send sample translations one per request instead of batching them '
+                            'per source language through /translate/batch')
     
     # Create a group for text-related arguments
     text_group = parser.add_argument_group('text translation arguments')
     text_group.add_argument('--text', help='Input text to translate')
     text_group.add_argument('--from', dest='from_lang',
                            help='Source language code (required if --text is used)',
-                           choices=['ar', 'zh', 'en', 'fr', 'de', 'it', 'ja', 'ko', 'pt', 'es'])
+                           choices=TranslationTester.LANGUAGES)
     text_group.add_argument('--to', dest='to_lang',
                            help='Target language code (required if --text is used)',
-                           choices=['ar', 'zh', 'en', 'fr', 'de', 'it', 'ja', 'ko', 'pt', 'es'])
+                           choices=TranslationTester.LANGUAGES)
+    text_group.add_argument('--stream', action='store_true',
+                           help='Stream the translation from /translate/stream as it is generated')
     
     args = parser.parse_args()
     
@@ -247,16 +514,19 @@ def main():
     if (args.from_lang or args.to_lang) and not args.text:
         parser.error("--from and --to can only be used when --text is provided")
     
-    tester = TranslationTester(args.url, verbose=args.verbose)
+    if args.stream and not args.text:
+        parser.error("--stream can only be used when --text is provided")
     
-    if args.text:
-        # Single translation mode
-        tester.test_single_translation(args.text, args.from_lang, args.to_lang)
-    else:
-        # Sample translations mode
-        tester.test_sample_translations()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
     
-    tester.print_summary()
+    if args.retries < 0:
+        parser.error("--retries cannot be negative")
+    
+    tester = TranslationTester(args.url, verbose=args.verbose, concurrency=args.concurrency,
+                               batch=args.batch, quiet=args.quiet, http2=args.http2,
+                               retries=args.retries)
+    asyncio.run(run(tester, args))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file